@@ -1,3 +1,4 @@
+from django.db import router, transaction
 from django.db.models import F
 from drf_spectacular.utils import extend_schema
 from rest_framework import status
@@ -22,6 +23,11 @@ from sentry.auth.superuser import is_active_superuser
 from sentry.loader.dynamic_sdk_options import get_default_loader_data
 from sentry.models.projectkey import ProjectKey, ProjectKeyStatus, UseCase
 
+STATUS_FILTERS = {
+    "active": ProjectKeyStatus.ACTIVE,
+    "inactive": ProjectKeyStatus.INACTIVE,
+}
+
 
 @extend_schema(tags=["Projects"])
 @region_silo_endpoint
@@ -51,23 +57,35 @@ class ProjectKeysEndpoint(ProjectEndpoint):
     def get(self, request: Request, project) -> Response:
         """
         Return a list of client keys bound to a project.
+
+        Results are cursor paginated by descending key id, at most 100 per
+        page; follow the `next` cursor in the `Link` header for more.
         """
         queryset = ProjectKey.objects.for_request(request).filter(
             project=project, roles=F("roles").bitor(ProjectKey.roles.store)
         )
         status = request.GET.get("status")
-        if status == "active":
-            queryset = queryset.filter(status=ProjectKeyStatus.ACTIVE)
-        elif status == "inactive":
-            queryset = queryset.filter(status=ProjectKeyStatus.INACTIVE)
+        if status in STATUS_FILTERS:
+            queryset = queryset.filter(status=STATUS_FILTERS[status])
         elif status:
             queryset = queryset.none()
 
+        def serialize_keys(keys: list[ProjectKey]):
+            # ProjectKeySerializer reads every column (including `data` for the
+            # loader options), so nothing can be deferred. It does however
+            # dereference `key.project` for each key, so reuse the project we
+            # already hold instead of fetching it once per row.
+            for key in keys:
+                key.set_cached_field_value("project", project)
+            return serialize(keys, request.user, request=request)
+
         return self.paginate(
             request=request,
             queryset=queryset,
             order_by="-id",
-            on_results=lambda x: serialize(x, request.user, request=request),
+            default_per_page=100,
+            max_per_page=100,
+            on_results=serialize_keys,
         )
 
     @extend_schema(
@@ -110,23 +128,26 @@ class ProjectKeysEndpoint(ProjectEndpoint):
         else:
             use_case = UseCase.USER.value
 
-        key = ProjectKey.objects.create(
-            project=project,
-            label=result.get("name"),
-            public_key=result.get("public"),
-            secret_key=result.get("secret"),
-            rate_limit_count=rate_limit_count,
-            rate_limit_window=rate_limit_window,
-            data=get_default_loader_data(project),
-            use_case=use_case,
-        )
+        with transaction.atomic(router.db_for_write(ProjectKey)):
+            key = ProjectKey.objects.create(
+                project=project,
+                label=result.get("name"),
+                public_key=result.get("public"),
+                secret_key=result.get("secret"),
+                rate_limit_count=rate_limit_count,
+                rate_limit_window=rate_limit_window,
+                data=get_default_loader_data(project),
+                use_case=use_case,
+            )
 
-        self.create_audit_entry(
-            request=request,
-            organization=project.organization,
-            target_object=key.id,
-            event=audit_log.get_event_id("PROJECTKEY_ADD"),
-            data=key.get_audit_log_data(),
-        )
+            # In the region silo this only enqueues a RegionOutbox row; the audit
+            # log itself is written asynchronously when the outbox is drained.
+            self.create_audit_entry(
+                request=request,
+                organization=project.organization,
+                target_object=key.id,
+                event=audit_log.get_event_id("PROJECTKEY_ADD"),
+                data=key.get_audit_log_data(),
+            )
 
         return Response(serialize(key, request.user, request=request), status=201)
@@ -1,14 +1,42 @@
 from collections import defaultdict
 from typing import DefaultDict, TypedDict
 
+from django.db.models import prefetch_related_objects
+
+from sentry import quotas
 from sentry.api.serializers import Serializer, register
 from sentry.constants import ALL_ACCESS_PROJECTS
-from sentry.discover.models import DatasetSourcesTypes, DiscoverSavedQuery, DiscoverSavedQueryTypes
+from sentry.discover.models import (
+    DatasetSourcesTypes,
+    DiscoverSavedQuery,
+    DiscoverSavedQueryProject,
+    DiscoverSavedQueryTypes,
+)
 from sentry.users.api.serializers.user import UserSerializerResponse
 from sentry.users.services.user.service import user_service
-from sentry.utils.dates import outside_retention_with_modified_start, parse_timestamp
+from sentry.utils.dates import outside_retention_days_with_modified_start, parse_timestamp
 
 DATASET_SOURCES = dict(DatasetSourcesTypes.as_choices())
+DATASET_NAMES = dict(DiscoverSavedQueryTypes.TYPES)
+
+# Keys of `DiscoverSavedQuery.query` that are copied into the response
+QUERY_KEYS = (
+    "environment",
+    "query",
+    "fields",
+    "widths",
+    "conditions",
+    "aggregations",
+    "range",
+    "start",
+    "end",
+    "orderby",
+    "limit",
+    "yAxis",
+    "display",
+    "topEvents",
+    "interval",
+)
 
 
 class DiscoverSavedQueryResponseOptional(TypedDict, total=False):
@@ -47,49 +75,79 @@ class DiscoverSavedQueryModelSerializer(Serializer):
     def get_attrs(self, item_list, user, **kwargs):
         result: DefaultDict[str, dict] = defaultdict(lambda: {"created_by": {}})
 
+        query_ids = []
+        created_by_ids = set()
+        for discover_saved_query in item_list:
+            # all-projects queries report ALL_ACCESS_PROJECTS, so their
+            # projects never need to be loaded
+            if not discover_saved_query.query.get("all_projects"):
+                query_ids.append(discover_saved_query.id)
+            if discover_saved_query.created_by_id:
+                created_by_ids.add(discover_saved_query.created_by_id)
+
         service_serialized = user_service.serialize_many(
-            filter={
-                "user_ids": [
-                    discover_saved_query.created_by_id
-                    for discover_saved_query in item_list
-                    if discover_saved_query.created_by_id
-                ]
-            },
+            filter={"user_ids": list(created_by_ids)},
             as_user=user if user.id else None,
         )
         serialized_users = {user["id"]: user for user in service_serialized}
 
+        saved_query_projects = DiscoverSavedQueryProject.objects.filter(
+            discover_saved_query_id__in=query_ids
+        ).values_list("discover_saved_query_id", "project_id")
+        projects_by_query: DefaultDict[int, list[int]] = defaultdict(list)
+        for discover_saved_query_id, project_id in saved_query_projects:
+            projects_by_query[discover_saved_query_id].append(project_id)
+
         for discover_saved_query in item_list:
             result[discover_saved_query]["created_by"] = serialized_users.get(
                 str(discover_saved_query.created_by_id)
             )
+            result[discover_saved_query]["projects"] = projects_by_query[discover_saved_query.id]
+
+        # expire queries that are beyond the retention period, looking up the
+        # retention once per organization rather than once per query
+        absolute_range_queries = []
+        for discover_saved_query in item_list:
+            query = discover_saved_query.query
+            if "start" not in query:
+                continue
+            start, end = parse_timestamp(query["start"]), parse_timestamp(query["end"])
+            if start and end:
+                absolute_range_queries.append((discover_saved_query, start, end))
+
+        prefetch_related_objects(
+            [discover_saved_query for discover_saved_query, _, _ in absolute_range_queries],
+            "organization",
+        )
+        retention_by_org: dict[int, int | None] = {}
+        for discover_saved_query, start, end in absolute_range_queries:
+            organization_id = discover_saved_query.organization_id
+            if organization_id not in retention_by_org:
+                retention_by_org[organization_id] = quotas.backend.get_event_retention(
+                    organization=discover_saved_query.organization
+                )
+            expired, modified_start = outside_retention_days_with_modified_start(
+                start, end, retention_by_org[organization_id]
+            )
+            result[discover_saved_query]["expired"] = expired
+            result[discover_saved_query]["start"] = (
+                modified_start.replace(tzinfo=None).isoformat(timespec="microseconds") + "Z"
+            )
 
         return result
 
     def serialize(self, obj, attrs, user, **kwargs) -> DiscoverSavedQueryResponse:
-        query_keys = [
-            "environment",
-            "query",
-            "fields",
-            "widths",
-            "conditions",
-            "aggregations",
-            "range",
-            "start",
-            "end",
-            "orderby",
-            "limit",
-            "yAxis",
-            "display",
-            "topEvents",
-            "interval",
-        ]
+        if obj.query.get("all_projects"):
+            projects = list(ALL_ACCESS_PROJECTS)
+        else:
+            projects = attrs.get("projects", [])
+
         data: DiscoverSavedQueryResponse = {
             "id": str(obj.id),
             "name": obj.name,
-            "projects": [project.id for project in obj.projects.all()],
+            "projects": projects,
             "version": obj.version or obj.query.get("version", 1),
-            "queryDataset": DiscoverSavedQueryTypes.get_type_name(obj.dataset),
+            "queryDataset": DATASET_NAMES.get(obj.dataset),
             "datasetSource": DATASET_SOURCES[obj.dataset_source],
             "expired": False,
             "dateCreated": obj.date_created,
@@ -97,21 +155,13 @@ class DiscoverSavedQueryModelSerializer(Serializer):
             "createdBy": attrs.get("created_by"),
         }
 
-        for key in query_keys:
-            if obj.query.get(key) is not None:
-                data[key] = obj.query[key]  # type: ignore[literal-required]
+        query = obj.query
+        for key in QUERY_KEYS:
+            if query.get(key) is not None:
+                data[key] = query[key]  # type: ignore[literal-required]
 
-        # expire queries that are beyond the retention period
-        if "start" in obj.query:
-            start, end = parse_timestamp(obj.query["start"]), parse_timestamp(obj.query["end"])
-            if start and end:
-                expired, modified_start = outside_retention_with_modified_start(
-                    start, end, obj.organization
-                )
-                data["expired"] = expired
-                data["start"] = modified_start.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
-
-        if obj.query.get("all_projects"):
-            data["projects"] = list(ALL_ACCESS_PROJECTS)
+        if "expired" in attrs:
+            data["expired"] = attrs["expired"]
+            data["start"] = attrs["start"]
 
         return data
@@ -1,8 +1,9 @@
+from collections import defaultdict
 from collections.abc import MutableMapping
 from typing import Any, TypedDict
 
 from sentry.api.serializers import Serializer, register, serialize
-from sentry.models.groupsearchview import GroupSearchView
+from sentry.models.groupsearchview import GroupSearchView, GroupSearchViewProject
 from sentry.models.groupsearchviewlastvisited import GroupSearchViewLastVisited
 from sentry.models.groupsearchviewstarred import GroupSearchViewStarred
 from sentry.models.savedsearch import SORT_LITERALS
@@ -34,18 +35,28 @@ class GroupSearchViewSerializer(Serializer):
     def get_attrs(self, item_list, user, **kwargs) -> MutableMapping[Any, Any]:
         attrs: MutableMapping[Any, Any] = {}
 
-        last_visited_views = GroupSearchViewLastVisited.objects.filter(
-            organization=self.organization,
-            user_id=user.id,
-            group_search_view_id__in=[item.id for item in item_list],
+        view_ids = tuple(item.id for item in item_list)
+
+        last_visited_map = dict(
+            GroupSearchViewLastVisited.objects.filter(
+                organization=self.organization,
+                user_id=user.id,
+                group_search_view_id__in=view_ids,
+            ).values_list("group_search_view_id", "last_visited")
         )
-        last_visited_map = {lv.group_search_view_id: lv for lv in last_visited_views}
+
+        view_projects = GroupSearchViewProject.objects.filter(
+            group_search_view_id__in=view_ids
+        ).values_list("group_search_view_id", "project_id")
+        projects_by_view: defaultdict[int, list[int]] = defaultdict(list)
+        for group_search_view_id, project_id in view_projects:
+            projects_by_view[group_search_view_id].append(project_id)
 
         for item in item_list:
-            last_visited = last_visited_map.get(item.id, None)
-            if last_visited:
-                attrs[item] = {}
-                attrs[item]["last_visited"] = last_visited.last_visited
+            attrs[item] = {
+                "last_visited": last_visited_map.get(item.id),
+                "projects": projects_by_view[item.id],
+            }
 
         return attrs
 
@@ -53,14 +64,14 @@ class GroupSearchViewSerializer(Serializer):
         if self.has_global_views is False:
             is_all_projects = False
 
-            projects = list(obj.projects.values_list("id", flat=True))
+            projects = list(attrs["projects"])
             num_projects = len(projects)
             if num_projects != 1:
                 projects = [projects[0] if num_projects > 1 else self.default_project]
 
         else:
             is_all_projects = obj.is_all_projects
-            projects = list(obj.projects.values_list("id", flat=True))
+            projects = attrs["projects"]
 
         return {
             "id": str(obj.id),
@@ -72,7 +83,7 @@ class GroupSearchViewSerializer(Serializer):
             "isAllProjects": is_all_projects,
             "environments": obj.environments,
             "timeFilters": obj.time_filters,
-            "lastVisited": attrs["last_visited"] if attrs else None,
+            "lastVisited": attrs.get("last_visited"),
             "dateCreated": obj.date_added,
             "dateUpdated": obj.date_updated,
         }
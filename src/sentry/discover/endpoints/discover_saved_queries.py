@@ -75,9 +75,9 @@ class DiscoverSavedQueriesEndpoint(OrganizationEndpoint):
             return self.respond(status=404)
 
         queryset = (
-            DiscoverSavedQuery.objects.filter(organization=organization)
-            .prefetch_related("projects")
-            .extra(select={"lower_name": "lower(name)"})
+            DiscoverSavedQuery.objects.filter(organization=organization).extra(
+                select={"lower_name": "lower(name)"}
+            )
         ).exclude(is_homepage=True)
         query = request.query_params.get("query")
         if query:
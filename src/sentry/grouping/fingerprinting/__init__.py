@@ -2,9 +2,9 @@ from __future__ import annotations
 
 import inspect
 import logging
-from collections.abc import Generator, Mapping, Sequence
+from collections.abc import Callable, Generator, Mapping, Sequence
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, NamedTuple, NotRequired, Self, TypedDict, TypeVar
+from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple, NotRequired, Self, TypedDict, TypeVar
 
 from django.conf import settings
 from parsimonious.exceptions import ParseError
@@ -20,7 +20,6 @@ from sentry.stacktraces.functions import get_function_name_for_frame
 from sentry.stacktraces.platform import get_behavior_family_for_platform
 from sentry.utils.event_frames import find_stack_frames
 from sentry.utils.glob import glob_match
-from sentry.utils.safe import get_path
 from sentry.utils.strings import unescape_string
 from sentry.utils.tag_normalization import normalized_sdk_tag_from_event
 
@@ -148,106 +147,105 @@ class FingerprintRuleMatch(NamedTuple):
 
 
 class EventDatastore:
+    """
+    Lazily-populated view of the parts of an event fingerprinting rules can match against.
+
+    Values for a given match type are only pulled out of the event the first time a rule asks for
+    them, so match types which no rule uses (most often `frames`) are never computed.
+    """
+
+    __slots__ = ("event", "_values_by_match_type")
+
     def __init__(self, event: Mapping[str, Any]) -> None:
         self.event = event
-        self._exceptions: list[_ExceptionInfo] | None = None
-        self._frames: list[_FrameInfo] | None = None
-        self._messages: list[_MessageInfo] | None = None
-        self._log_info: list[_LogInfo] | None = None
-        self._toplevel: list[_MessageInfo | _ExceptionInfo] | None = None
-        self._tags: list[dict[str, str]] | None = None
-        self._sdk: list[_SdkInfo] | None = None
-        self._family: list[_FamilyInfo] | None = None
-        self._release: list[_ReleaseInfo] | None = None
+        # Only match types some rule has actually asked about end up in here
+        self._values_by_match_type: dict[str, list[Any]] = {}
 
     def get_values(self, match_type: str) -> list[dict[str, Any]]:
         """
         Pull values from all the spots in the event appropriate to the given match type.
         """
-        return getattr(self, "_get_" + match_type)()
+        values = self._values_by_match_type.get(match_type)
+        if values is None:
+            values = self._values_by_match_type[match_type] = self._getters[match_type](self)
+        return values
 
     def _get_messages(self) -> list[_MessageInfo]:
-        if self._messages is None:
-            self._messages = []
-            message = get_path(self.event, "logentry", "formatted", filter=True)
-            if message:
-                self._messages.append({"message": message})
-        return self._messages
+        logentry = self.event.get("logentry")
+        message = logentry.get("formatted") if isinstance(logentry, Mapping) else None
+        return [{"message": message}] if message else []
 
     def _get_log_info(self) -> list[_LogInfo]:
-        if self._log_info is None:
-            log_info: _LogInfo = {}
-            logger = get_path(self.event, "logger", filter=True)
-            if logger:
-                log_info["logger"] = logger
-            level = get_path(self.event, "level", filter=True)
-            if level:
-                log_info["level"] = level
-            if log_info:
-                self._log_info = [log_info]
-            else:
-                self._log_info = []
-        return self._log_info
+        log_info: _LogInfo = {}
+        logger = self.event.get("logger")
+        if logger:
+            log_info["logger"] = logger
+        level = self.event.get("level")
+        if level:
+            log_info["level"] = level
+        return [log_info] if log_info else []
 
     def _get_exceptions(self) -> list[_ExceptionInfo]:
-        if self._exceptions is None:
-            self._exceptions = []
-            for exc in get_path(self.event, "exception", "values", filter=True) or ():
-                self._exceptions.append(
-                    {
-                        "type": exc.get("type"),
-                        "value": exc.get("value"),
-                    }
-                )
-        return self._exceptions
+        exception = self.event.get("exception")
+        exception_values = exception.get("values") if isinstance(exception, Mapping) else None
+        return [
+            {
+                "type": exc.get("type"),
+                "value": exc.get("value"),
+            }
+            for exc in exception_values or ()
+            if exc is not None
+        ]
 
     def _get_frames(self) -> list[_FrameInfo]:
-        if self._frames is None:
-            self._frames = frames = []
-
-            def _push_frame(frame: dict[str, object]) -> None:
-                platform = frame.get("platform") or self.event.get("platform")
-                func = get_function_name_for_frame(frame, platform)
-                frames.append(
-                    {
-                        "function": func or "<unknown>",
-                        "abs_path": frame.get("abs_path") or frame.get("filename"),
-                        "filename": frame.get("filename"),
-                        "module": frame.get("module"),
-                        "package": frame.get("package"),
-                        "app": frame.get("in_app"),
-                    }
-                )
-
-            find_stack_frames(self.event, _push_frame)
-        return self._frames
+        frames: list[_FrameInfo] = []
+        event_platform = self.event.get("platform")
+
+        def _push_frame(frame: dict[str, object]) -> None:
+            platform = frame.get("platform") or event_platform
+            func = get_function_name_for_frame(frame, platform)
+            filename = frame.get("filename")
+            frames.append(
+                {
+                    "function": func or "<unknown>",
+                    "abs_path": frame.get("abs_path") or filename,
+                    "filename": filename,
+                    "module": frame.get("module"),
+                    "package": frame.get("package"),
+                    "app": frame.get("in_app"),
+                }
+            )
+
+        find_stack_frames(self.event, _push_frame)
+        return frames
 
     def _get_toplevel(self) -> list[_MessageInfo | _ExceptionInfo]:
-        if self._toplevel is None:
-            self._toplevel = [*self._get_messages(), *self._get_exceptions()]
-        return self._toplevel
+        return [*self._get_messages(), *self.get_values("exceptions")]
 
     def _get_tags(self) -> list[dict[str, str]]:
-        if self._tags is None:
-            self._tags = [
-                {"tags.%s" % k: v for (k, v) in get_path(self.event, "tags", filter=True) or ()}
-            ]
-        return self._tags
+        # Keyed by the bare tag name, so we don't have to build a prefixed key for every tag on the
+        # event when rules only ever look at a few of them
+        return [dict(filter(None, self.event.get("tags") or ()))]
 
     def _get_sdk(self) -> list[_SdkInfo]:
-        if self._sdk is None:
-            self._sdk = [{"sdk": normalized_sdk_tag_from_event(self.event)}]
-        return self._sdk
+        return [{"sdk": normalized_sdk_tag_from_event(self.event)}]
 
     def _get_family(self) -> list[_FamilyInfo]:
-        self._family = self._family or [
-            {"family": get_behavior_family_for_platform(self.event.get("platform"))}
-        ]
-        return self._family
+        return [{"family": get_behavior_family_for_platform(self.event.get("platform"))}]
 
     def _get_release(self) -> list[_ReleaseInfo]:
-        self._release = self._release or [{"release": self.event.get("release")}]
-        return self._release
+        return [{"release": self.event.get("release")}]
+
+    _getters: ClassVar[dict[str, Callable[[EventDatastore], list[Any]]]] = {
+        "toplevel": _get_toplevel,
+        "log_info": _get_log_info,
+        "exceptions": _get_exceptions,
+        "tags": _get_tags,
+        "sdk": _get_sdk,
+        "family": _get_family,
+        "release": _get_release,
+        "frames": _get_frames,
+    }
 
 
 class FingerprintingRules:
@@ -315,6 +313,9 @@ class FingerprintingRules:
 
     @staticmethod
     def from_config_string(s: Any, bases: Sequence[str] | None = None) -> Any:
+        # Parsing isn't on the per-event path: project rules are cached as JSON (see
+        # `get_fingerprinting_config_for_project`) and the built-in configs are parsed once, at
+        # import time. That's why it's fine to use the (relatively slow) parsimonious grammar here.
         try:
             tree = fingerprinting_grammar.parse(s)
         except ParseError as e:
@@ -380,41 +381,90 @@ MATCHERS = {
     "release": "release",
 }
 
+# Rough relative cost of pulling each match type's values out of an event. Single-value types are
+# cheap, whereas `frames` means walking every stacktrace. Since a rule only matches if every one of
+# its match types does, checking the cheap ones first lets us bail before doing the expensive work.
+MATCH_TYPE_COSTS = {
+    "family": 0,
+    "sdk": 0,
+    "release": 0,
+    "log_info": 0,
+    "tags": 1,
+    "toplevel": 2,
+    "exceptions": 3,
+    "frames": 4,
+}
+
+
+def _get_canonical_matcher_key(key: str) -> str:
+    """
+    Convert a matcher key as written in a config (which may be a discover field name) into the form
+    `FingerprintMatcher` expects, raising if the key isn't one we know how to match on.
+    """
+    if key.startswith("tags."):
+        return key
+    try:
+        return MATCHERS[key]
+    except KeyError:
+        raise InvalidFingerprintingConfig("Unknown matcher '%s'" % key)
+
 
 class FingerprintMatcher:
+    __slots__ = (
+        "key",
+        "pattern",
+        "negated",
+        "match_type",
+        "_flags",
+        "_app",
+        "_literal_pattern",
+        "_literal_pattern_lower",
+        "_positive_match_for_key",
+    )
+
     def __init__(
         self,
-        key: str,  # The event attribute on which to match
+        key: str,  # The (canonical) event attribute on which to match
         pattern: str,  # The value to match (or to not match, depending on `negated`)
         negated: bool = False,  # If True, match when `event[key]` does NOT equal `pattern`
     ) -> None:
-        if key.startswith("tags."):
-            self.key = key
-        else:
-            try:
-                self.key = MATCHERS[key]
-            except KeyError:
-                raise InvalidFingerprintingConfig("Unknown matcher '%s'" % key)
+        self.key = key
         self.pattern = pattern
         self.negated = negated
-
-    @property
-    def match_type(self) -> str:
-        if self.key == "message":
-            return "toplevel"
-        if self.key in ("logger", "level"):
-            return "log_info"
-        if self.key in ("type", "value"):
-            return "exceptions"
-        if self.key.startswith("tags."):
-            return "tags"
-        if self.key == "sdk":
-            return "sdk"
-        if self.key == "family":
-            return "family"
-        if self.key == "release":
-            return "release"
-        return "frames"
+        # Glob patterns are compiled (and cached) on the relay side, but the `family`, `sdk` and
+        # `app` patterns are parsed here, so do that once rather than for every event value
+        self._flags = (
+            frozenset(pattern.split(",")) if self.key in ("family", "sdk") else frozenset()
+        )
+        self._app = bool_from_string(pattern) if self.key == "app" else None
+        # Patterns without any glob syntax (and without characters whose case-folding or
+        # normalization could differ between Python and relay) can be matched with a plain string
+        # comparison instead of a trip through the glob matcher
+        self._literal_pattern = (
+            pattern
+            if pattern.isascii() and not any(char in pattern for char in "*?[]{}\\")
+            else None
+        )
+        self._literal_pattern_lower = (
+            self._literal_pattern.lower() if self._literal_pattern is not None else None
+        )
+        self.match_type = self._get_match_type()
+        self._positive_match_for_key = self._get_positive_match_for_key()
+
+    def _get_match_type(self) -> str:
+        match self.key:
+            case "message":
+                return "toplevel"
+            case "logger" | "level":
+                return "log_info"
+            case "type" | "value":
+                return "exceptions"
+            case "sdk" | "family" | "release":
+                return self.key
+            case key if key.startswith("tags."):
+                return "tags"
+            case _:
+                return "frames"
 
     def matches(self, event_values: dict[str, Any]) -> bool:
         match_found = self._positive_match(event_values)
@@ -423,6 +473,11 @@ class FingerprintMatcher:
     def _positive_path_match(self, value: str | None) -> bool:
         if value is None:
             return False
+        if self._literal_pattern_lower is not None and value.isascii():
+            normalized_value = value.replace("\\", "/").lower()
+            return normalized_value == self._literal_pattern_lower or (
+                not value.startswith("/") and "/" + normalized_value == self._literal_pattern_lower
+            )
         if glob_match(value, self.pattern, ignorecase=True, doublestar=True, path_normalize=True):
             return True
         if not value.startswith("/") and glob_match(
@@ -431,42 +486,89 @@ class FingerprintMatcher:
             return True
         return False
 
+    def _positive_glob_match(self, value: str, ignorecase: bool) -> bool:
+        if self._literal_pattern is not None and value.isascii():
+            if ignorecase:
+                return value.lower() == self._literal_pattern_lower
+            return value == self._literal_pattern
+        return glob_match(value, self.pattern, ignorecase=ignorecase)
+
     def _positive_match(self, event_values: dict[str, Any]) -> bool:
+        return self._positive_match_for_key(self, event_values)
+
+    def _get_positive_match_for_key(
+        self,
+    ) -> Callable[[FingerprintMatcher, dict[str, Any]], bool]:
+        """
+        Pick the match function for this matcher's key. Keys never change after construction, so
+        this is done once, rather than re-checking the key against every option on each match.
+        """
         # Handle cases where `self.key` isn't 1-to-1 with the corresponding key in `event_values`
         if self.key == "path":
-            return any(
-                self._positive_path_match(value)
-                # Use a set so that if the values match, we don't needlessly check both
-                for value in {event_values.get("abs_path"), event_values.get("filename")}
-            )
-
+            return FingerprintMatcher._positive_frame_path_match
         if self.key == "message":
-            return any(
-                value is not None and glob_match(value, self.pattern, ignorecase=True)
-                # message tests against exception value also, as this is what users expect
-                for value in [event_values.get("message"), event_values.get("value")]
-            )
+            return FingerprintMatcher._positive_message_match
+        if self.match_type == "tags":
+            return FingerprintMatcher._positive_tag_match
 
         # For the rest, `self.key` matches the key in `event_values`
-        value = event_values.get(self.key)
+        if self.key in ["package", "release"]:
+            return FingerprintMatcher._positive_value_path_match
+        if self.key in ["family", "sdk"]:
+            return FingerprintMatcher._positive_flag_match
+        if self.key == "app":
+            return FingerprintMatcher._positive_app_match
+        if self.key in ["level", "value"]:
+            return FingerprintMatcher._positive_case_insensitive_match
+        return FingerprintMatcher._positive_case_sensitive_match
+
+    def _positive_frame_path_match(self, event_values: dict[str, Any]) -> bool:
+        return any(
+            self._positive_path_match(value)
+            # Use a set so that if the values match, we don't needlessly check both
+            for value in {event_values.get("abs_path"), event_values.get("filename")}
+        )
 
+    def _positive_message_match(self, event_values: dict[str, Any]) -> bool:
+        return any(
+            value is not None and self._positive_glob_match(value, ignorecase=True)
+            # message tests against exception value also, as this is what users expect
+            for value in [event_values.get("message"), event_values.get("value")]
+        )
+
+    def _positive_tag_match(self, event_values: dict[str, Any]) -> bool:
+        # Tag values are keyed by the bare tag name, without our `tags.` prefix
+        value = event_values.get(self.key[len("tags.") :])
         if value is None:
             return False
+        return self._positive_glob_match(value, ignorecase=False)
 
-        if self.key in ["package", "release"]:
-            return self._positive_path_match(value)
+    def _positive_value_path_match(self, event_values: dict[str, Any]) -> bool:
+        return self._positive_path_match(event_values.get(self.key))
 
-        if self.key in ["family", "sdk"]:
-            flags = self.pattern.split(",")
-            return "all" in flags or value in flags
+    def _positive_flag_match(self, event_values: dict[str, Any]) -> bool:
+        value = event_values.get(self.key)
+        if value is None:
+            return False
+        return "all" in self._flags or value in self._flags
 
-        if self.key == "app":
-            return value == bool_from_string(self.pattern)
+    def _positive_app_match(self, event_values: dict[str, Any]) -> bool:
+        value = event_values.get(self.key)
+        if value is None:
+            return False
+        return value == self._app
 
-        if self.key in ["level", "value"]:
-            return glob_match(value, self.pattern, ignorecase=True)
+    def _positive_case_insensitive_match(self, event_values: dict[str, Any]) -> bool:
+        value = event_values.get(self.key)
+        if value is None:
+            return False
+        return self._positive_glob_match(value, ignorecase=True)
 
-        return glob_match(value, self.pattern, ignorecase=False)
+    def _positive_case_sensitive_match(self, event_values: dict[str, Any]) -> bool:
+        value = event_values.get(self.key)
+        if value is None:
+            return False
+        return self._positive_glob_match(value, ignorecase=False)
 
     def _to_config_structure(self) -> list[str]:
         key = self.key
@@ -479,7 +581,7 @@ class FingerprintMatcher:
         key, pattern = matcher
 
         negated = key.startswith("!")
-        key = key.lstrip("!")
+        key = _get_canonical_matcher_key(key.lstrip("!"))
 
         return cls(key, pattern, negated)
 
@@ -493,6 +595,15 @@ class FingerprintMatcher:
 
 
 class FingerprintRule:
+    __slots__ = (
+        "matchers",
+        "fingerprint",
+        "attributes",
+        "is_builtin",
+        "_config_structure",
+        "_matchers_by_match_type",
+    )
+
     def __init__(
         self,
         matchers: Sequence[FingerprintMatcher],
@@ -504,29 +615,54 @@ class FingerprintRule:
         self.fingerprint = fingerprint
         self.attributes = attributes
         self.is_builtin = is_builtin
+        self._config_structure: FingerprintRuleJSON | None = None
 
-    def test_for_match_with_event(
-        self, event_datastore: EventDatastore
-    ) -> None | FingerprintWithAttributes:
+        # Matchers never change after the rule is built, so group them by match type (cheapest
+        # first) once here rather than every time the rule is tested against an event
         matchers_by_match_type: dict[str, list[FingerprintMatcher]] = {}
-        for matcher in self.matchers:
+        for matcher in matchers:
             matchers_by_match_type.setdefault(matcher.match_type, []).append(matcher)
+        self._matchers_by_match_type = tuple(
+            (match_type, tuple(matchers_for_type))
+            for match_type, matchers_for_type in sorted(
+                matchers_by_match_type.items(),
+                key=lambda item: MATCH_TYPE_COSTS.get(item[0], len(MATCH_TYPE_COSTS)),
+            )
+        )
 
-        for match_type, matchers in matchers_by_match_type.items():
+    def test_for_match_with_event(
+        self, event_datastore: EventDatastore
+    ) -> None | FingerprintWithAttributes:
+        for match_type, matchers in self._matchers_by_match_type:
             for event_values in event_datastore.get_values(match_type):
                 if all(matcher.matches(event_values) for matcher in matchers):
                     break
+            # This also covers events which don't have any values of this type at all (no frames,
+            # no exceptions, etc.), in which case the rule fails without testing any matchers
             else:
                 return None
 
         return FingerprintWithAttributes(self.fingerprint, self.attributes)
 
     def _to_config_structure(self) -> FingerprintRuleJSON:
+        # Rules are never modified once built, and matched rules are serialized for every event they
+        # match, so only build the structure once. (`is_builtin` gets set after construction for
+        # built-in rules, so it's left out of the cached version.)
+        if self._config_structure is None:
+            self._config_structure = {
+                "text": self.text,
+                "matchers": [x._to_config_structure() for x in self.matchers],
+                "fingerprint": self.fingerprint,
+                "attributes": self.attributes,
+            }
+
+        # Copy (down to the nested lists and dicts) so callers mutating the result don't affect the
+        # cached version or the rule itself
         config_structure: FingerprintRuleJSON = {
-            "text": self.text,
-            "matchers": [x._to_config_structure() for x in self.matchers],
-            "fingerprint": self.fingerprint,
-            "attributes": self.attributes,
+            "text": self._config_structure["text"],
+            "matchers": [list(matcher) for matcher in self._config_structure["matchers"]],
+            "fingerprint": list(self._config_structure["fingerprint"]),
+            "attributes": self._config_structure["attributes"].copy(),
         }
 
         # only adding this key if it's true to avoid having to change in a bazillion asserts
@@ -565,10 +701,18 @@ class FingerprintRule:
 class FingerprintingVisitor(NodeVisitorBase):
     visit_empty = lambda *a: None
     unwrapped_exceptions = (InvalidFingerprintingConfig,)
+    # Whitespace and punctuation nodes never carry anything we use, so there's no need to walk them
+    # (or, in the case of `_`, their many `space` children)
+    ignored_node_names = frozenset(("_", "space", "sep", "follow", "newline"))
 
     def __init__(self, bases: Sequence[str] | None) -> None:
         self.bases = bases
 
+    def visit(self, node: Node) -> Any:
+        if node.expr_name in self.ignored_node_names:
+            return None
+        return super().visit(node)
+
     # a note on the typing of `children`
     # these are actually lists of sub-lists of the various types
     # so instead typed as tuples so unpacking works
@@ -622,7 +766,7 @@ class FingerprintingVisitor(NodeVisitorBase):
         self, _: object, children: tuple[object, list[str], str, object, str]
     ) -> FingerprintMatcher:
         _, negation, key, _, pattern = children
-        return FingerprintMatcher(key, pattern, bool(negation))
+        return FingerprintMatcher(_get_canonical_matcher_key(key), pattern, bool(negation))
 
     def visit_matcher_type(self, _: object, children: list[str]) -> str:
         return children[0]
@@ -697,11 +841,14 @@ def _load_configs() -> dict[str, list[FingerprintRule]]:
         configs.setdefault(config_name, [])
 
         try:
-            with open(config_file_path) as config_file:
-                str_conf = config_file.read().rstrip()
-                configs[config_name].extend(
-                    BuiltInFingerprintingRules.from_config_string(str_conf).rules
-                )
+            str_conf = config_file_path.read_text().rstrip()
+            rules = BuiltInFingerprintingRules.from_config_string(str_conf).rules
+            # Matcher grouping and pattern parsing already happen when rules are constructed. Also
+            # build the cached serialized form now, so the first event a built-in rule matches in
+            # each process doesn't pay for it.
+            for rule in rules:
+                rule._to_config_structure()
+            configs[config_name].extend(rules)
         except InvalidFingerprintingConfig:
             logger.exception(
                 "Fingerprinting Config %s Invalid",
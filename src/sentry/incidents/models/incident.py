@@ -65,17 +65,18 @@ class IncidentManager(BaseManager["Incident"]):
         )
         incident = cache.get(cache_key)
         if incident is None:
-            try:
-                incident_query = Incident.objects.filter(
-                    type=IncidentType.ALERT_TRIGGERED.value,
-                    alert_rule=alert_rule,
-                    projects=project,
-                    subscription=subscription,
-                )
-                incident = incident_query.exclude(status=IncidentStatus.CLOSED.value).order_by(
-                    "-date_added"
-                )[0]
-            except IndexError:
+            incident_query = Incident.objects.filter(
+                type=IncidentType.ALERT_TRIGGERED.value,
+                alert_rule=alert_rule,
+                projects=project,
+                subscription=subscription,
+            )
+            incident = (
+                incident_query.exclude(status=IncidentStatus.CLOSED.value)
+                .order_by("-date_added")
+                .first()
+            )
+            if incident is None:
                 # Set this to False so that we can have a negative cache as well.
                 incident = False
             cache.set(cache_key, incident)
@@ -28,7 +28,7 @@ class MessagingInteractionType(StrEnum):
     ARCHIVE = "ARCHIVE"
     ASSIGN_DIALOG = "ASSIGN_DIALOG"
     ASSIGN = "ASSIGN"
-    UNASSIGN = "ASSIGN"
+    UNASSIGN = "UNASSIGN"
     RESOLVE_DIALOG = "RESOLVE_DIALOG"
     RESOLVE = "RESOLVE"
     UNRESOLVE = "UNRESOLVE"
@@ -68,7 +68,7 @@ class MessagingInteractionEvent(IntegrationEventLifecycleMetric):
         return self.spec.provider_slug
 
     def get_interaction_type(self) -> str:
-        return str(self.interaction_type)
+        return self.interaction_type
 
     def get_extras(self) -> Mapping[str, Any]:
         return {
@@ -52,11 +52,7 @@ SLACK_MIDDLE_PARSERS_FAILURE_DATADOG_METRIC = "sentry.middleware.integrations.sl
 
 
 def record_lifecycle_termination_level(lifecycle: EventLifecycle, error: SlackApiError) -> None:
-    if (
-        (reason := unpack_slack_api_error(error))
-        and reason is not None
-        and reason in SLACK_SDK_HALT_ERROR_CATEGORIES
-    ):
+    if (reason := unpack_slack_api_error(error)) and reason in SLACK_SDK_HALT_ERROR_CATEGORIES:
         lifecycle.record_halt(reason.message)
     else:
         lifecycle.record_failure(error)
@@ -25,13 +25,15 @@ SLACK_SDK_ERROR_CATEGORIES = (
 """
 Errors that are user configuration errors and should be recorded as a halt for SLOs.
 """
-SLACK_SDK_HALT_ERROR_CATEGORIES = (
-    ACCOUNT_INACTIVE,
-    CHANNEL_NOT_FOUND,
-    CHANNEL_ARCHIVED,
-    RATE_LIMITED,
-    RESTRICTED_ACTION,
-    MESSAGE_LIMIT_EXCEEDED,
+SLACK_SDK_HALT_ERROR_CATEGORIES = frozenset(
+    (
+        ACCOUNT_INACTIVE,
+        CHANNEL_NOT_FOUND,
+        CHANNEL_ARCHIVED,
+        RATE_LIMITED,
+        RESTRICTED_ACTION,
+        MESSAGE_LIMIT_EXCEEDED,
+    )
 )
 
 _CATEGORIES_BY_MESSAGE = {c.message: c for c in SLACK_SDK_ERROR_CATEGORIES}
@@ -74,9 +74,7 @@ class OrganizationGroupSearchViewsEndpoint(OrganizationEndpoint):
 
         has_global_views = features.has("organizations:global-views", organization)
 
-        query = GroupSearchView.objects.filter(
-            organization=organization, user_id=request.user.id
-        ).prefetch_related("projects")
+        query = GroupSearchView.objects.filter(organization=organization, user_id=request.user.id)
 
         # Return only the default view(s) if user has no custom views yet
         if not query.exists():
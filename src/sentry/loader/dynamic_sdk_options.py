@@ -13,6 +13,11 @@ def get_dynamic_sdk_loader_option(project_key, option: DynamicSdkLoaderOption, d
 
 
 def get_default_loader_data(project):
+    """
+    Loader data for a new key of `project`. This is a single project option
+    read, which `ProjectOption.objects` already serves from its own cache, so
+    it is cheap enough to call on the request path without extra caching.
+    """
     dynamic_sdk_loader_options = project.get_option("sentry:default_loader_options", None)
 
     if dynamic_sdk_loader_options is not None:
@@ -108,7 +108,7 @@ class SavedSearch(Model):
     def is_pinned(self):
         return self.visibility == Visibility.OWNER_PINNED
 
-    __repr__ = sane_repr("project_id", "name")
+    __repr__ = sane_repr("organization_id", "name")
 
     def normalize_before_relocation_import(
         self, pk_map: PrimaryKeyMap, scope: ImportScope, flags: ImportFlags
@@ -78,9 +78,9 @@ class ResolvedAttribute(ResolvedColumn):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ArgumentDefinition:
-    argument_types: set[constants.SearchType] | None = None
+    argument_types: frozenset[constants.SearchType] | None = None
     # The public alias for the default arg, the SearchResolver will resolve this value
     default_arg: str | None = None
     # Sets the argument as an attribute, for custom functions like `http_response rate` we might have non-attribute parameters
@@ -200,7 +200,7 @@ class ResolvedConditionalAggregate(ResolvedFunction):
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class FunctionDefinition:
     """
     The FunctionDefinition is a base class for defining a function, a function is a non-attribute column.
@@ -232,7 +232,7 @@ class FunctionDefinition:
         raise NotImplementedError()
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class AggregateDefinition(FunctionDefinition):
     internal_function: Function.ValueType
 
@@ -250,7 +250,7 @@ class AggregateDefinition(FunctionDefinition):
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ConditionalAggregateDefinition(FunctionDefinition):
     """
     The definition of a conditional aggregation,
@@ -282,7 +282,7 @@ class ConditionalAggregateDefinition(FunctionDefinition):
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class FormulaDefinition(FunctionDefinition):
     # A function that takes in the resolved argument and returns a Column.BinaryFormula
     formula_resolver: Callable[[Any], Column.BinaryFormula]
@@ -110,9 +110,9 @@ VALID_GRANULARITIES = frozenset(
         24 * 3600,  # hours
     }
 )
-TRUTHY_VALUES = {"1", "true"}
-FALSEY_VALUES = {"0", "false"}
-BOOLEAN_VALUES = TRUTHY_VALUES.union(FALSEY_VALUES)
+TRUTHY_VALUES = frozenset(("1", "true"))
+FALSEY_VALUES = frozenset(("0", "false"))
+BOOLEAN_VALUES = TRUTHY_VALUES | FALSEY_VALUES
 
 PROJECT_FIELDS = {"project", "project.slug", "project.name"}
 REVERSE_CONTEXT_ERROR = "Unknown value {} for filter {}, expecting one of: {}"
@@ -461,9 +461,8 @@ class SearchResolver:
         # TODO: Handle different units properly
         value = term.value.value
 
-        if term.operator in constants.OPERATOR_MAP:
-            operator = constants.AGGREGATION_OPERATOR_MAP[term.operator]
-        else:
+        operator = constants.AGGREGATION_OPERATOR_MAP.get(term.operator)
+        if operator is None:
             raise InvalidSearchQuery(f"Unknown operator: {term.operator}")
 
         return (
@@ -766,7 +765,7 @@ class SearchResolver:
                 and parsed_argument.search_type not in argument.argument_types
             ):
                 raise InvalidSearchQuery(
-                    f"{argument} is invalid for {function}, its a {parsed_argument.search_type} type field but {function} expects a field that are one of these types: {argument.argument_types}"
+                    f"{argument} is invalid for {function}, its a {parsed_argument.search_type} type field but {function} expects a field that are one of these types: {', '.join(sorted(argument.argument_types))}"
                 )
             parsed_args.append(parsed_argument)
 
@@ -8,21 +8,24 @@ from sentry.search.eap.columns import (
     ConditionalAggregateDefinition,
 )
 
+OP_KEY = AttributeKey(name="sentry.op", type=AttributeKey.TYPE_STRING)
+
+NUMERIC_ARGUMENT_TYPES: frozenset[constants.SearchType] = frozenset(
+    ["duration", "number", *constants.SIZE_TYPE, *constants.DURATION_TYPE]
+)
+NUMERIC_OR_PERCENTAGE_ARGUMENT_TYPES: frozenset[constants.SearchType] = (
+    NUMERIC_ARGUMENT_TYPES | frozenset(["percentage"])
+)
+
 
 def count_processor(count_value: int | None) -> int:
-    if count_value is None:
-        return 0
-    else:
-        return count_value
+    return count_value or 0
 
 
 def resolve_count_op_filter(op_value: str) -> TraceItemFilter:
     return TraceItemFilter(
         comparison_filter=ComparisonFilter(
-            key=AttributeKey(
-                name="sentry.op",
-                type=AttributeKey.TYPE_STRING,
-            ),
+            key=OP_KEY,
             op=ComparisonFilter.OP_EQUALS,
             value=AttributeValue(val_str=op_value),
         )
@@ -33,8 +36,8 @@ SPAN_CONDITIONAL_AGGREGATE_DEFINITIONS = {
     "count_op": ConditionalAggregateDefinition(
         internal_function=Function.FUNCTION_COUNT,
         default_search_type="integer",
-        arguments=[ArgumentDefinition(argument_types={"string"}, is_attribute=False)],
-        key=AttributeKey(type=AttributeKey.TYPE_STRING, name="sentry.op"),
+        arguments=[ArgumentDefinition(argument_types=frozenset(["string"]), is_attribute=False)],
+        key=OP_KEY,
         filter_resolver=resolve_count_op_filter,
     )
 }
@@ -45,12 +48,7 @@ SPAN_AGGREGATE_DEFINITIONS = {
         default_search_type="duration",
         arguments=[
             ArgumentDefinition(
-                argument_types={
-                    "duration",
-                    "number",
-                    *constants.SIZE_TYPE,
-                    *constants.DURATION_TYPE,
-                },
+                argument_types=NUMERIC_ARGUMENT_TYPES,
                 default_arg="span.duration",
             )
         ],
@@ -60,13 +58,7 @@ SPAN_AGGREGATE_DEFINITIONS = {
         default_search_type="duration",
         arguments=[
             ArgumentDefinition(
-                argument_types={
-                    "duration",
-                    "number",
-                    "percentage",
-                    *constants.SIZE_TYPE,
-                    *constants.DURATION_TYPE,
-                },
+                argument_types=NUMERIC_OR_PERCENTAGE_ARGUMENT_TYPES,
                 default_arg="span.duration",
             )
         ],
@@ -76,13 +68,7 @@ SPAN_AGGREGATE_DEFINITIONS = {
         default_search_type="duration",
         arguments=[
             ArgumentDefinition(
-                argument_types={
-                    "duration",
-                    "number",
-                    "percentage",
-                    *constants.SIZE_TYPE,
-                    *constants.DURATION_TYPE,
-                },
+                argument_types=NUMERIC_OR_PERCENTAGE_ARGUMENT_TYPES,
                 default_arg="span.duration",
             )
         ],
@@ -95,12 +81,7 @@ SPAN_AGGREGATE_DEFINITIONS = {
         processor=count_processor,
         arguments=[
             ArgumentDefinition(
-                argument_types={
-                    "duration",
-                    "number",
-                    *constants.SIZE_TYPE,
-                    *constants.DURATION_TYPE,
-                },
+                argument_types=NUMERIC_ARGUMENT_TYPES,
                 default_arg="span.duration",
             )
         ],
@@ -112,12 +93,7 @@ SPAN_AGGREGATE_DEFINITIONS = {
         processor=count_processor,
         arguments=[
             ArgumentDefinition(
-                argument_types={
-                    "duration",
-                    "number",
-                    *constants.SIZE_TYPE,
-                    *constants.DURATION_TYPE,
-                },
+                argument_types=NUMERIC_ARGUMENT_TYPES,
                 default_arg="span.duration",
             )
         ],
@@ -128,12 +104,7 @@ SPAN_AGGREGATE_DEFINITIONS = {
         default_search_type="duration",
         arguments=[
             ArgumentDefinition(
-                argument_types={
-                    "duration",
-                    "number",
-                    *constants.SIZE_TYPE,
-                    *constants.DURATION_TYPE,
-                },
+                argument_types=NUMERIC_ARGUMENT_TYPES,
                 default_arg="span.duration",
             )
         ],
@@ -143,12 +114,7 @@ SPAN_AGGREGATE_DEFINITIONS = {
         default_search_type="duration",
         arguments=[
             ArgumentDefinition(
-                argument_types={
-                    "duration",
-                    "number",
-                    *constants.SIZE_TYPE,
-                    *constants.DURATION_TYPE,
-                },
+                argument_types=NUMERIC_ARGUMENT_TYPES,
                 default_arg="span.duration",
             )
         ],
@@ -159,12 +125,7 @@ SPAN_AGGREGATE_DEFINITIONS = {
         default_search_type="duration",
         arguments=[
             ArgumentDefinition(
-                argument_types={
-                    "duration",
-                    "number",
-                    *constants.SIZE_TYPE,
-                    *constants.DURATION_TYPE,
-                },
+                argument_types=NUMERIC_ARGUMENT_TYPES,
                 default_arg="span.duration",
             )
         ],
@@ -174,12 +135,7 @@ SPAN_AGGREGATE_DEFINITIONS = {
         default_search_type="duration",
         arguments=[
             ArgumentDefinition(
-                argument_types={
-                    "duration",
-                    "number",
-                    *constants.SIZE_TYPE,
-                    *constants.DURATION_TYPE,
-                },
+                argument_types=NUMERIC_ARGUMENT_TYPES,
                 default_arg="span.duration",
             )
         ],
@@ -189,12 +145,7 @@ SPAN_AGGREGATE_DEFINITIONS = {
         default_search_type="duration",
         arguments=[
             ArgumentDefinition(
-                argument_types={
-                    "duration",
-                    "number",
-                    *constants.SIZE_TYPE,
-                    *constants.DURATION_TYPE,
-                },
+                argument_types=NUMERIC_ARGUMENT_TYPES,
                 default_arg="span.duration",
             )
         ],
@@ -204,12 +155,7 @@ SPAN_AGGREGATE_DEFINITIONS = {
         default_search_type="duration",
         arguments=[
             ArgumentDefinition(
-                argument_types={
-                    "duration",
-                    "number",
-                    *constants.SIZE_TYPE,
-                    *constants.DURATION_TYPE,
-                },
+                argument_types=NUMERIC_ARGUMENT_TYPES,
                 default_arg="span.duration",
             )
         ],
@@ -219,12 +165,7 @@ SPAN_AGGREGATE_DEFINITIONS = {
         default_search_type="duration",
         arguments=[
             ArgumentDefinition(
-                argument_types={
-                    "duration",
-                    "number",
-                    *constants.SIZE_TYPE,
-                    *constants.DURATION_TYPE,
-                },
+                argument_types=NUMERIC_ARGUMENT_TYPES,
                 default_arg="span.duration",
             )
         ],
@@ -234,13 +175,7 @@ SPAN_AGGREGATE_DEFINITIONS = {
         default_search_type="duration",
         arguments=[
             ArgumentDefinition(
-                argument_types={
-                    "duration",
-                    "number",
-                    "percentage",
-                    *constants.SIZE_TYPE,
-                    *constants.DURATION_TYPE,
-                },
+                argument_types=NUMERIC_OR_PERCENTAGE_ARGUMENT_TYPES,
                 default_arg="span.duration",
             )
         ],
@@ -250,13 +185,7 @@ SPAN_AGGREGATE_DEFINITIONS = {
         default_search_type="duration",
         arguments=[
             ArgumentDefinition(
-                argument_types={
-                    "duration",
-                    "number",
-                    "percentage",
-                    *constants.SIZE_TYPE,
-                    *constants.DURATION_TYPE,
-                },
+                argument_types=NUMERIC_OR_PERCENTAGE_ARGUMENT_TYPES,
                 default_arg="span.duration",
             )
         ],
@@ -268,7 +197,7 @@ SPAN_AGGREGATE_DEFINITIONS = {
         processor=count_processor,
         arguments=[
             ArgumentDefinition(
-                argument_types={"string"},
+                argument_types=frozenset(["string"]),
             )
         ],
     ),
@@ -32,22 +32,23 @@ TOTAL_SPAN_COUNT = Column(
 )
 
 
-def http_response_rate(code: Literal[1, 2, 3, 4, 5]) -> Column.BinaryFormula:
+STATUS_CODE_KEY = AttributeKey(name="sentry.status_code", type=AttributeKey.TYPE_STRING)
+TRACE_STATUS_KEY = AttributeKey(name="sentry.trace.status", type=AttributeKey.TYPE_STRING)
+CACHE_HIT_KEY = AttributeKey(name="cache.hit", type=AttributeKey.TYPE_BOOLEAN)
+TTFD_KEY = AttributeKey(name="sentry.ttfd", type=AttributeKey.TYPE_STRING)
+TTID_KEY = AttributeKey(name="sentry.ttid", type=AttributeKey.TYPE_STRING)
+
+
+def _build_http_response_rate(code: int) -> Column.BinaryFormula:
     response_codes = RESPONSE_CODE_MAP[code]
     return Column.BinaryFormula(
         left=Column(
             conditional_aggregation=AttributeConditionalAggregation(
                 aggregate=Function.FUNCTION_COUNT,
-                key=AttributeKey(
-                    name="sentry.status_code",
-                    type=AttributeKey.TYPE_STRING,
-                ),
+                key=STATUS_CODE_KEY,
                 filter=TraceItemFilter(
                     comparison_filter=ComparisonFilter(
-                        key=AttributeKey(
-                            name="sentry.status_code",
-                            type=AttributeKey.TYPE_STRING,
-                        ),
+                        key=STATUS_CODE_KEY,
                         op=ComparisonFilter.OP_IN,
                         value=AttributeValue(
                             val_str_array=StrArray(
@@ -64,10 +65,7 @@ def http_response_rate(code: Literal[1, 2, 3, 4, 5]) -> Column.BinaryFormula:
         right=Column(
             conditional_aggregation=AttributeConditionalAggregation(
                 aggregate=Function.FUNCTION_COUNT,
-                key=AttributeKey(
-                    name="sentry.status_code",
-                    type=AttributeKey.TYPE_STRING,
-                ),
+                key=STATUS_CODE_KEY,
                 label="total_request_count",
                 extrapolation_mode=ExtrapolationMode.EXTRAPOLATION_MODE_NONE,
             ),
@@ -75,21 +73,24 @@ def http_response_rate(code: Literal[1, 2, 3, 4, 5]) -> Column.BinaryFormula:
     )
 
 
+# There are only a handful of response code classes, so build each formula once up front rather
+# than on every query. Callers only ever copy these into a Column, they are never mutated.
+HTTP_RESPONSE_RATE_FORMULAS = {code: _build_http_response_rate(code) for code in RESPONSE_CODE_MAP}
+
+
+def http_response_rate(code: Literal[1, 2, 3, 4, 5]) -> Column.BinaryFormula:
+    return HTTP_RESPONSE_RATE_FORMULAS[code]
+
+
 def trace_status_rate(status: str) -> Column.BinaryFormula:
     return Column.BinaryFormula(
         left=Column(
             conditional_aggregation=AttributeConditionalAggregation(
                 aggregate=Function.FUNCTION_COUNT,
-                key=AttributeKey(
-                    name="sentry.trace.status",
-                    type=AttributeKey.TYPE_STRING,
-                ),
+                key=TRACE_STATUS_KEY,
                 filter=TraceItemFilter(
                     comparison_filter=ComparisonFilter(
-                        key=AttributeKey(
-                            name="sentry.trace.status",
-                            type=AttributeKey.TYPE_STRING,
-                        ),
+                        key=TRACE_STATUS_KEY,
                         op=ComparisonFilter.OP_EQUALS,
                         value=AttributeValue(
                             val_str=status,
@@ -105,21 +106,15 @@ def trace_status_rate(status: str) -> Column.BinaryFormula:
     )
 
 
-def cache_miss_rate(arg: None) -> Column.BinaryFormula:
+def _build_cache_miss_rate() -> Column.BinaryFormula:
     return Column.BinaryFormula(
         left=Column(
             conditional_aggregation=AttributeConditionalAggregation(
                 aggregate=Function.FUNCTION_COUNT,
-                key=AttributeKey(
-                    name="cache.hit",
-                    type=AttributeKey.TYPE_BOOLEAN,
-                ),
+                key=CACHE_HIT_KEY,
                 filter=TraceItemFilter(
                     comparison_filter=ComparisonFilter(
-                        key=AttributeKey(
-                            name="cache.hit",
-                            type=AttributeKey.TYPE_BOOLEAN,
-                        ),
+                        key=CACHE_HIT_KEY,
                         op=ComparisonFilter.OP_EQUALS,
                         value=AttributeValue(
                             val_bool=False,
@@ -134,10 +129,7 @@ def cache_miss_rate(arg: None) -> Column.BinaryFormula:
         right=Column(
             conditional_aggregation=AttributeConditionalAggregation(
                 aggregate=Function.FUNCTION_COUNT,
-                key=AttributeKey(
-                    name="cache.hit",
-                    type=AttributeKey.TYPE_BOOLEAN,
-                ),
+                key=CACHE_HIT_KEY,
                 label="total_cache_count",
                 extrapolation_mode=ExtrapolationMode.EXTRAPOLATION_MODE_NONE,
             ),
@@ -145,15 +137,22 @@ def cache_miss_rate(arg: None) -> Column.BinaryFormula:
     )
 
 
+CACHE_MISS_RATE_FORMULA = _build_cache_miss_rate()
+
+
+def cache_miss_rate(arg: None) -> Column.BinaryFormula:
+    return CACHE_MISS_RATE_FORMULA
+
+
 def ttfd_contribution_rate(args: None) -> Column.BinaryFormula:
     return Column.BinaryFormula(
         left=Column(
             conditional_aggregation=AttributeConditionalAggregation(
                 aggregate=Function.FUNCTION_COUNT,
-                key=AttributeKey(name="sentry.ttfd", type=AttributeKey.TYPE_STRING),
+                key=TTFD_KEY,
                 filter=TraceItemFilter(
                     comparison_filter=ComparisonFilter(
-                        key=AttributeKey(name="sentry.ttfd", type=AttributeKey.TYPE_STRING),
+                        key=TTFD_KEY,
                         op=ComparisonFilter.OP_EQUALS,
                         value=AttributeValue(val_str="ttfd"),
                     )
@@ -172,10 +171,10 @@ def ttid_contribution_rate(args: None) -> Column.BinaryFormula:
         left=Column(
             conditional_aggregation=AttributeConditionalAggregation(
                 aggregate=Function.FUNCTION_COUNT,
-                key=AttributeKey(name="sentry.ttid", type=AttributeKey.TYPE_STRING),
+                key=TTID_KEY,
                 filter=TraceItemFilter(
                     comparison_filter=ComparisonFilter(
-                        key=AttributeKey(name="sentry.ttid", type=AttributeKey.TYPE_STRING),
+                        key=TTID_KEY,
                         op=ComparisonFilter.OP_EQUALS,
                         value=AttributeValue(val_str="ttid"),
                     )
@@ -195,7 +194,7 @@ SPAN_FORMULA_DEFINITIONS = {
         is_aggregate=True,
         arguments=[
             ArgumentDefinition(
-                argument_types={"integer"},
+                argument_types=frozenset(["integer"]),
                 is_attribute=False,
                 validator=literal_validator(["1", "2", "3", "4", "5"]),
             )
@@ -213,7 +212,7 @@ SPAN_FORMULA_DEFINITIONS = {
         is_aggregate=True,
         arguments=[
             ArgumentDefinition(
-                argument_types={"string"},
+                argument_types=frozenset(["string"]),
                 is_attribute=False,
             )
         ],
@@ -181,6 +181,16 @@ def outside_retention_with_modified_start(
     start datetime if start is out of retention.
     """
     retention = quotas.backend.get_event_retention(organization=organization)
+    return outside_retention_days_with_modified_start(start, end, retention)
+
+
+def outside_retention_days_with_modified_start(
+    start: datetime, end: datetime, retention: int | None
+) -> tuple[bool, datetime]:
+    """
+    Same as `outside_retention_with_modified_start`, for callers that have
+    already looked up the organization's retention (in days).
+    """
     if not retention:
         return False, start
 
@@ -1,3 +1,4 @@
+import time
 from typing import TypedDict
 
 from django.conf import settings
@@ -28,12 +29,20 @@ class MarketoError(Exception):
 class MarketoClient:
     OAUTH_URL = "/identity/oauth/token"
     SUBMIT_FORM_URL = "/rest/v1/leads/submitForm.json"
+    # Marketo error codes for an invalid or expired access token
+    TOKEN_ERROR_CODES = frozenset(("601", "602"))
+    # Refresh the token this many seconds before Marketo says it expires
+    TOKEN_EXPIRY_LEEWAY = 60
+
+    def __init__(self):
+        self._token: str | None = None
+        self._token_expires_at = 0.0
 
     def make_request(self, url: str, *args, method="GET", **kwargs):
         base_url = settings.MARKETO_BASE_URL or ""
         full_url = base_url + url
         session = http.build_session()
-        resp = getattr(session, method.lower())(full_url, *args, **kwargs)
+        resp = session.request(method, full_url, *args, **kwargs)
         resp.raise_for_status()
         return resp.json()
 
@@ -44,6 +53,11 @@ class MarketoClient:
         headers["Content-Type"] = "application/json"
         data = self.make_request(url, *args, headers=headers, **kwargs)
 
+        if not data.get("success") and self._is_token_error(data):
+            # the cached token was revoked or expired early, fetch a new one and retry once
+            headers["Authorization"] = f"Bearer {self._refresh_token()}"
+            data = self.make_request(url, *args, headers=headers, **kwargs)
+
         if not data.get("success"):
             raise MarketoError(data)
 
@@ -70,6 +84,22 @@ class MarketoClient:
         return self.make_rest_request(self.SUBMIT_FORM_URL, method="POST", json=body)
 
     @property
-    def token(self):
+    def token(self) -> str:
+        # the client is shared between threads, so only read the cached token once
+        token = self._token
+        if token is None or time.monotonic() >= self._token_expires_at:
+            token = self._refresh_token()
+        return token
+
+    def _refresh_token(self) -> str:
         resp = self.retrieve_token()
-        return resp["access_token"]
+        token = resp["access_token"]
+        self._token_expires_at = (
+            time.monotonic() + resp.get("expires_in", 0) - self.TOKEN_EXPIRY_LEEWAY
+        )
+        self._token = token
+        return token
+
+    def _is_token_error(self, data) -> bool:
+        errors = data.get("errors") or []
+        return any(error.get("code") in self.TOKEN_ERROR_CODES for error in errors)
@@ -36,7 +36,6 @@ from sentry.workflow_engine.models import (
 from sentry.workflow_engine.models.data_condition import Condition
 from sentry.workflow_engine.types import DetectorPriorityLevel
 from sentry.workflow_engine.typings.notification_action import (
-    OnCallDataBlob,
     SentryAppDataBlob,
     SentryAppIdentifier,
 )
@@ -88,14 +87,11 @@ def get_action_type(alert_rule_trigger_action: AlertRuleTriggerAction) -> Action
 def build_sentry_app_data_blob(
     alert_rule_trigger_action: AlertRuleTriggerAction,
 ) -> dict[str, Any]:
-    if not alert_rule_trigger_action.sentry_app_config:
+    config = alert_rule_trigger_action.sentry_app_config
+    if not config:
         return {}
     # Convert config to proper type for SentryAppDataBlob
-    settings = (
-        [alert_rule_trigger_action.sentry_app_config]
-        if isinstance(alert_rule_trigger_action.sentry_app_config, dict)
-        else alert_rule_trigger_action.sentry_app_config
-    )
+    settings = [config] if isinstance(config, dict) else config
     return dataclasses.asdict(SentryAppDataBlob.from_list(settings))
 
 
@@ -116,8 +112,8 @@ def build_on_call_data_blob(
     if not isinstance(config, dict):
         return {"priority": default_priority}
 
-    priority = config.get("priority", default_priority)
-    return dataclasses.asdict(OnCallDataBlob(priority=priority))
+    # the OnCallDataBlob shape, built directly rather than through dataclasses.asdict
+    return {"priority": config.get("priority", default_priority)}
 
 
 def build_action_data_blob(
@@ -229,10 +225,8 @@ def migrate_metric_action(
             f"Could not find a matching Action.Type for the trigger action {alert_rule_trigger_action.id}"
         )
 
-    # Ensure action_type is Action.Type before passing to functions
-    action_type_enum = Action.Type(action_type)
-    data = build_action_data_blob(alert_rule_trigger_action, action_type_enum)
-    target_identifier = get_target_identifier(alert_rule_trigger_action, action_type_enum)
+    data = build_action_data_blob(alert_rule_trigger_action, action_type)
+    target_identifier = get_target_identifier(alert_rule_trigger_action, action_type)
     action_config = build_action_config(
         alert_rule_trigger_action.target_display,
         target_identifier,
@@ -240,7 +234,7 @@ def migrate_metric_action(
     )
 
     action = Action.objects.create(
-        type=action_type_enum,
+        type=action_type,
         data=data,
         integration_id=alert_rule_trigger_action.integration_id,
         config=action_config,
@@ -278,11 +272,11 @@ def migrate_metric_data_conditions(
         if alert_rule.threshold_type == AlertRuleThresholdType.ABOVE.value
         else Condition.LESS
     )
-    condition_result = PRIORITY_MAP.get(alert_rule_trigger.label, DetectorPriorityLevel.HIGH)
+    priority = PRIORITY_MAP.get(alert_rule_trigger.label, DetectorPriorityLevel.HIGH)
 
     detector_trigger = DataCondition.objects.create(
         comparison=alert_rule_trigger.alert_threshold,
-        condition_result=condition_result,
+        condition_result=priority,
         type=threshold_type,
         condition_group=detector_data_condition_group,
     )
@@ -301,7 +295,7 @@ def migrate_metric_data_conditions(
     )
 
     action_filter = DataCondition.objects.create(
-        comparison=PRIORITY_MAP.get(alert_rule_trigger.label, DetectorPriorityLevel.HIGH),
+        comparison=priority,
         condition_result=True,
         type=Condition.ISSUE_PRIORITY_EQUALS,
         condition_group=data_condition_group,
@@ -379,7 +373,9 @@ def migrate_resolve_threshold_data_conditions(
     data_condition_group = DataConditionGroup.objects.create(
         organization_id=alert_rule.organization_id
     )
-    alert_rule_workflow = AlertRuleWorkflow.objects.get(alert_rule=alert_rule)
+    alert_rule_workflow = AlertRuleWorkflow.objects.select_related("workflow").get(
+        alert_rule=alert_rule
+    )
     WorkflowDataConditionGroup.objects.create(
         condition_group=data_condition_group,
         workflow=alert_rule_workflow.workflow,
@@ -667,13 +663,9 @@ def dual_update_migrated_alert_rule_trigger(
     updated_detector_trigger_fields: dict[str, Any] = {}
     updated_action_filter_fields: dict[str, Any] = {}
     if "label" in updated_fields:
-        label = updated_fields["label"]
-        updated_detector_trigger_fields["condition_result"] = PRIORITY_MAP.get(
-            label, DetectorPriorityLevel.HIGH
-        )
-        updated_action_filter_fields["comparison"] = PRIORITY_MAP.get(
-            label, DetectorPriorityLevel.HIGH
-        )
+        updated_priority = PRIORITY_MAP.get(updated_fields["label"], DetectorPriorityLevel.HIGH)
+        updated_detector_trigger_fields["condition_result"] = updated_priority
+        updated_action_filter_fields["comparison"] = updated_priority
     if "alert_threshold" in updated_fields:
         updated_detector_trigger_fields["comparison"] = updated_fields["alert_threshold"]
 
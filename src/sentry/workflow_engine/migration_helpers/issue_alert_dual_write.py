@@ -20,7 +20,10 @@ from sentry.workflow_engine.models import (
     Workflow,
     WorkflowDataConditionGroup,
 )
-from sentry.workflow_engine.models.data_condition import Condition
+from sentry.workflow_engine.models.data_condition import (
+    Condition,
+    enforce_data_condition_json_schema,
+)
 from sentry.workflow_engine.processors.workflow import WorkflowDataConditionGroupType
 
 logger = logging.getLogger(__name__)
@@ -47,9 +50,10 @@ def bulk_create_data_conditions(
 
     filtered_data_conditions = [dc for dc in dcg_conditions if dc.type not in SKIPPED_CONDITIONS]
 
-    # try one by one, keeping errors
+    # bulk_create does not send pre_save, so enforce the comparison schema ourselves
     for dc in filtered_data_conditions:
-        dc.save()
+        enforce_data_condition_json_schema(dc)
+    DataCondition.objects.bulk_create(filtered_data_conditions)
 
 
 def create_if_dcg(
@@ -88,11 +92,14 @@ def create_workflow_actions(if_dcg: DataConditionGroup, actions: list[dict[str,
 def update_migrated_issue_alert(rule: Rule) -> Workflow | None:
     data = rule.data
 
-    try:
-        alert_rule_workflow = AlertRuleWorkflow.objects.get(rule=rule)
-    except AlertRuleWorkflow.DoesNotExist:
+    alert_rule_workflow = (
+        AlertRuleWorkflow.objects.select_related("workflow__when_condition_group")
+        .filter(rule=rule)
+        .first()
+    )
+    if alert_rule_workflow is None:
         # OK state, rule may not have been migrated
-        logger.exception(
+        logger.error(
             "workflow_engine.issue_alert.updated.error",
             extra={"rule_id": rule.id, "error": "AlertRuleWorkflow does not exist"},
         )
@@ -112,11 +119,16 @@ def update_migrated_issue_alert(rule: Rule) -> Workflow | None:
         match=data["action_match"],
     )
 
-    try:
-        if_dcg = WorkflowDataConditionGroup.objects.get(workflow=workflow).condition_group
-    except WorkflowDataConditionGroup.DoesNotExist:
+    workflow_dcg = (
+        WorkflowDataConditionGroup.objects.select_related("condition_group")
+        .filter(workflow=workflow)
+        .first()
+    )
+    if workflow_dcg is not None:
+        if_dcg = workflow_dcg.condition_group
+    else:
         # OK state because we can recreate the IF DCG but should not happen
-        logger.exception(
+        logger.error(
             "workflow_engine.issue_alert.updated.error",
             extra={
                 "workflow_id": workflow.id,
@@ -153,7 +165,17 @@ def update_migrated_issue_alert(rule: Rule) -> Workflow | None:
     workflow.name = rule.label
 
     workflow.enabled = True
-    workflow.save()
+    workflow.save(
+        update_fields=[
+            "environment",
+            "config",
+            "owner_user_id",
+            "owner_team",
+            "name",
+            "enabled",
+            "date_updated",
+        ]
+    )
 
     return workflow
 
@@ -187,11 +209,10 @@ def update_dcg(
 
 
 def delete_migrated_issue_alert(rule: Rule) -> int | None:
-    try:
-        alert_rule_workflow = AlertRuleWorkflow.objects.get(rule=rule)
-    except AlertRuleWorkflow.DoesNotExist:
+    alert_rule_workflow = AlertRuleWorkflow.objects.filter(rule=rule).first()
+    if alert_rule_workflow is None:
         # OK state, rule may not have been migrated
-        logger.exception(
+        logger.error(
             "workflow_engine.issue_alert.deleted.error",
             extra={"rule_id": rule.id, "error": "AlertRuleWorkflow does not exist"},
         )
@@ -201,12 +222,16 @@ def delete_migrated_issue_alert(rule: Rule) -> int | None:
     workflow_id = workflow.id
 
     # delete all associated IF DCGs and their conditions
-    workflow_dcgs = WorkflowDataConditionGroup.objects.filter(workflow=workflow)
-    for workflow_dcg in workflow_dcgs:
-        if_dcg = workflow_dcg.condition_group
-        if_dcg.conditions.all().delete()
-        delete_workflow_actions(if_dcg=if_dcg)
-        if_dcg.delete()
+    if_dcg_ids = list(
+        WorkflowDataConditionGroup.objects.filter(workflow=workflow).values_list(
+            "condition_group_id", flat=True
+        )
+    )
+    DataCondition.objects.filter(condition_group_id__in=if_dcg_ids).delete()
+    dcg_actions = DataConditionGroupAction.objects.filter(condition_group_id__in=if_dcg_ids)
+    Action.objects.filter(id__in=dcg_actions.values("action_id")).delete()
+    dcg_actions.delete()
+    DataConditionGroup.objects.filter(id__in=if_dcg_ids).delete()
 
     if not workflow.when_condition_group:
         # OK, this shouldn't happen but should not prevent deletion
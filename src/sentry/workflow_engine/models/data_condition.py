@@ -139,9 +139,9 @@ class DataCondition(DefaultFieldsModel):
             )
             return None
 
-        if condition_type in CONDITION_OPS:
+        op = CONDITION_OPS.get(condition_type)
+        if op is not None:
             # If the condition is a base type, handle it directly
-            op = CONDITION_OPS[Condition(self.type)]
             result = op(cast(Any, value), self.comparison)
             return self.get_condition_result() if result else None
 
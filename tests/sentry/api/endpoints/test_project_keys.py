@@ -25,6 +25,23 @@ class ListProjectKeysTest(APITestCase):
         assert len(response.data) == 1
         assert response.data[0]["public"] == key.public_key
 
+    def test_excludes_keys_without_store_role(self):
+        project = self.create_project()
+        key = ProjectKey.objects.get_or_create(project=project)[0]
+        api_only_key = ProjectKey.objects.create(project=project, roles=ProjectKey.roles.api)
+        self.login_as(user=self.user)
+        url = reverse(
+            "sentry-api-0-project-keys",
+            kwargs={
+                "organization_id_or_slug": project.organization.slug,
+                "project_id_or_slug": project.slug,
+            },
+        )
+        response = self.client.get(url)
+        assert response.status_code == 200
+        assert [k["public"] for k in response.data] == [key.public_key]
+        assert api_only_key.public_key not in [k["public"] for k in response.data]
+
     def test_use_case(self):
         """Regular user can access user DSNs but not internal DSNs"""
         project = self.create_project()
@@ -259,6 +259,47 @@ release:foo                                     -> release-foo
     )
 
 
+def test_literal_path_matching() -> None:
+    rules = FingerprintingRules.from_config_string(
+        """
+path:"/src/App.js"                              -> app-js
+package:"libfoo.so"                             -> libfoo
+"""
+    )
+
+    def match_frame(frame: dict[str, Any]) -> list[str] | None:
+        event = {"exception": {"values": [{"stacktrace": {"frames": [frame]}}]}}
+        match = rules.get_fingerprint_values_for_event(event)
+        return match.fingerprint if match else None
+
+    assert match_frame({"abs_path": "/src/App.js"}) == ["app-js"]
+    assert match_frame({"abs_path": "/SRC/app.JS"}) == ["app-js"]
+    assert match_frame({"filename": "src/App.js"}) == ["app-js"]
+    assert match_frame({"abs_path": "\\src\\App.js"}) == ["app-js"]
+    assert match_frame({"abs_path": "/lib/src/App.js"}) is None
+    assert match_frame({"package": "LIBFOO.SO"}) == ["libfoo"]
+    assert match_frame({"package": "/usr/lib/libfoo.so"}) is None
+
+
+def test_literal_pattern_matching() -> None:
+    rules = FingerprintingRules.from_config_string(
+        """
+type:"DatabaseUnavailable"                      -> database
+level:"warning"                                 -> warning
+"""
+    )
+
+    def match_event(event: dict[str, Any]) -> list[str] | None:
+        match = rules.get_fingerprint_values_for_event(event)
+        return match.fingerprint if match else None
+
+    assert match_event({"exception": {"values": [{"type": "DatabaseUnavailable"}]}}) == ["database"]
+    # `type` matching is case-sensitive, `level` matching isn't
+    assert match_event({"exception": {"values": [{"type": "databaseunavailable"}]}}) is None
+    assert match_event({"level": "WARNING"}) == ["warning"]
+    assert match_event({"level": "warning!"}) is None
+
+
 def test_variable_resolution() -> None:
     # TODO: This should be fleshed out to test way more cases, at which point we'll need to add some
     # actual data here
@@ -0,0 +1,9 @@
+from sentry.integrations.messaging.metrics import MessagingInteractionType
+
+
+def test_interaction_types_are_distinct() -> None:
+    assert MessagingInteractionType.UNASSIGN is not MessagingInteractionType.ASSIGN
+    assert MessagingInteractionType.UNASSIGN == "UNASSIGN"
+
+    # Members sharing a value become aliases of each other and get recorded under the same name
+    assert len(MessagingInteractionType.__members__) == len(MessagingInteractionType)
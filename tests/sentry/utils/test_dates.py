@@ -1,6 +1,11 @@
 import datetime
 
-from sentry.utils.dates import date_to_utc_datetime, parse_stats_period, parse_timestamp
+from sentry.utils.dates import (
+    date_to_utc_datetime,
+    outside_retention_days_with_modified_start,
+    parse_stats_period,
+    parse_timestamp,
+)
 
 
 def test_parse_stats_period():
@@ -28,3 +33,20 @@ def test_parse_timestamp():
         2024, 5, 20, 17, 29, tzinfo=datetime.UTC
     )
     assert parse_timestamp("2024-05-20T17:29:00gu") is None
+
+
+def test_outside_retention_days_with_modified_start():
+    now = datetime.datetime.now(datetime.UTC)
+    start = now - datetime.timedelta(days=100)
+    end = now - datetime.timedelta(days=95)
+
+    assert outside_retention_days_with_modified_start(start, end, None) == (False, start)
+
+    expired, modified_start = outside_retention_days_with_modified_start(start, end, 90)
+    assert expired is True
+    assert modified_start > end
+
+    end = now - datetime.timedelta(days=1)
+    expired, modified_start = outside_retention_days_with_modified_start(start, end, 90)
+    assert expired is False
+    assert start < modified_start < end
@@ -0,0 +1,76 @@
+import re
+
+import pytest
+import responses
+from django.test import override_settings
+
+from sentry.testutils.cases import TestCase
+from sentry.utils.marketo_client import MarketoClient, MarketoError
+
+BASE_URL = "https://marketo.example.com"
+TOKEN_URL = re.compile(re.escape(BASE_URL + MarketoClient.OAUTH_URL))
+SUBMIT_FORM_URL = BASE_URL + MarketoClient.SUBMIT_FORM_URL
+
+
+@override_settings(MARKETO_BASE_URL=BASE_URL, MARKETO_FORM_ID="123")
+class MarketoClientTest(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.marketo = MarketoClient()
+
+    def add_token_response(self, token="token", expires_in=3600):
+        responses.add(
+            responses.GET,
+            TOKEN_URL,
+            json={"access_token": token, "expires_in": expires_in},
+        )
+
+    @responses.activate
+    def test_reuses_token(self):
+        self.add_token_response()
+        responses.add(responses.POST, SUBMIT_FORM_URL, json={"success": True})
+
+        self.marketo.submit_form({"email": "test@sentry.io"})
+        self.marketo.submit_form({"email": "test@sentry.io"})
+
+        token_calls = [call for call in responses.calls if TOKEN_URL.match(call.request.url)]
+        assert len(token_calls) == 1
+        assert responses.calls[-1].request.headers["Authorization"] == "Bearer token"
+
+    @responses.activate
+    def test_refreshes_expired_token(self):
+        self.add_token_response(token="first", expires_in=0)
+        self.add_token_response(token="second")
+        responses.add(responses.POST, SUBMIT_FORM_URL, json={"success": True})
+
+        self.marketo.submit_form({"email": "test@sentry.io"})
+        self.marketo.submit_form({"email": "test@sentry.io"})
+
+        assert responses.calls[-1].request.headers["Authorization"] == "Bearer second"
+
+    @responses.activate
+    def test_retries_once_on_invalid_token(self):
+        self.add_token_response(token="revoked")
+        self.add_token_response(token="fresh")
+        responses.add(
+            responses.POST,
+            SUBMIT_FORM_URL,
+            json={"success": False, "errors": [{"code": "601", "message": "Access token invalid"}]},
+        )
+        responses.add(responses.POST, SUBMIT_FORM_URL, json={"success": True})
+
+        assert self.marketo.submit_form({"email": "test@sentry.io"}) == {"success": True}
+        assert responses.calls[-1].request.headers["Authorization"] == "Bearer fresh"
+
+    @responses.activate
+    def test_raises_other_errors(self):
+        self.add_token_response()
+        responses.add(
+            responses.POST,
+            SUBMIT_FORM_URL,
+            json={"success": False, "errors": [{"code": "1003", "message": "Invalid form"}]},
+        )
+
+        with pytest.raises(MarketoError) as excinfo:
+            self.marketo.submit_form({"email": "test@sentry.io"})
+        assert excinfo.value.code == "1003"